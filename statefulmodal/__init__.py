@@ -1,6 +1,36 @@
 """StatefulModal - A pedagogical template for Modal + FastHTML + SQLite web applications."""
 
-from statefulmodal.app import app, create_app, Database, User
+import importlib.util
+import sys
 
-__all__ = ["app", "create_app", "Database", "User"]
-__version__ = "0.1.0"
+__all__ = ("modal_app", "create_app", "Database", "User")
+__version__ = "0.2.0"
+
+# statefulmodal.app is registered up front but loaded lazily: LazyLoader
+# creates the module object without running it, and the module body (which
+# imports Modal) only executes on the first attribute access. So
+# `import statefulmodal.app` is cheap until something on it is used.
+_spec = importlib.util.find_spec(f"{__name__}.app")
+_spec.loader = importlib.util.LazyLoader(_spec.loader)
+app = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = app
+_spec.loader.exec_module(app)
+del _spec, importlib, sys  # only needed for the registration above
+
+
+def __getattr__(name):
+    """
+    Resolve modal_app, create_app, Database and User from the app module (PEP 562).
+
+    Importing the package itself - e.g. just to read __version__ - then
+    doesn't pull in Modal, FastHTML and the rest of the app module. Each
+    name is cached in globals(), so later lookups are plain attribute hits.
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(app, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
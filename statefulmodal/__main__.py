@@ -0,0 +1,74 @@
+"""
+Command-line launcher: python -m statefulmodal <command>
+
+Each command is a thin wrapper around the Modal CLI pointed at app.py, e.g.
+`python -m statefulmodal serve` runs `modal serve .../statefulmodal/app.py::modal_app`.
+
+This module deliberately doesn't import statefulmodal.app (or Modal,
+FastHTML, ...). `python -m statefulmodal --help` only needs argparse, and
+the real work happens in the `modal` process, which loads app.py itself.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def modal(*args: str) -> int:
+    """Run the Modal CLI with the same interpreter and return its exit code."""
+    return subprocess.call([sys.executable, "-m", "modal", *args])
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Serve the app with live reload (local development)."""
+    return modal("serve", f"{APP_PATH}::modal_app")
+
+
+def deploy(args: argparse.Namespace) -> int:
+    """Deploy the app to production."""
+    return modal("deploy", f"{APP_PATH}::modal_app")
+
+
+def init_admin(args: argparse.Namespace) -> int:
+    """Add an email to the allow-list (use make-admin after first login)."""
+    return modal("run", f"{APP_PATH}::init_admin", f"--email={args.email}")
+
+
+def list_users(args: argparse.Namespace) -> int:
+    """List all users and the allow-list."""
+    return modal("run", f"{APP_PATH}::list_users")
+
+
+def make_admin(args: argparse.Namespace) -> int:
+    """Grant admin privileges to an existing user."""
+    return modal("run", f"{APP_PATH}::make_admin", f"--email={args.email}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m statefulmodal",
+        description="StatefulModal Template - Modal + FastHTML + SQLite. "
+        "See README.md for complete setup instructions.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    for name, func in [("serve", serve), ("deploy", deploy), ("list-users", list_users)]:
+        commands.add_parser(name, help=func.__doc__).set_defaults(func=func)
+
+    for name, func in [("init-admin", init_admin), ("make-admin", make_admin)]:
+        command = commands.add_parser(name, help=func.__doc__)
+        command.add_argument("--email", required=True)
+        command.set_defaults(func=func)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,10 +20,10 @@ HOW TO USE THIS TEMPLATE:
 3. Authenticate: modal token new
 4. Create required secrets (see SECRETS SETUP section below)
 5. Create the volume: modal volume create statefulmodal-data
-6. Deploy: modal deploy app.py
+6. Deploy: modal deploy app.py::modal_app
 
 For local development:
-    modal serve app.py
+    modal serve app.py::modal_app
 
 SECRETS SETUP:
 --------------
@@ -73,8 +73,10 @@ import modal
 # - Secret: Secure storage for API keys and credentials
 # =============================================================================
 
-# Create the Modal app - this is the entry point for everything
-app = modal.App(
+# Create the Modal app - this is the entry point for everything.
+# It's called modal_app, not app, so it doesn't shadow the statefulmodal.app
+# module; that's why the serve/deploy commands end in ::modal_app.
+modal_app = modal.App(
     name="statefulmodal",  # This name appears in the Modal dashboard
 )
 
@@ -91,8 +93,9 @@ image = (
     modal.Image.debian_slim(python_version="3.12")
     # Install Python packages from PyPI
     .pip_install(
-        "python-fasthtml>=0.12.0",  # Web framework
+        "python-fasthtml>=0.12.41",  # Web framework
         "python-dotenv>=1.0.0",      # Environment variable management
+        "orjson>=3.9.0",             # Fast JSON for the API endpoints
     )
 )
 
@@ -121,6 +124,11 @@ volume = modal.Volume.from_name(
 VOLUME_PATH = "/data"
 DATABASE_PATH = f"{VOLUME_PATH}/app.db"
 
+# How many requests a single container handles at once (see @modal.concurrent
+# in Section 4). The database connection pool is sized to match, so every
+# concurrent request can hold a connection without waiting.
+MAX_CONCURRENT_INPUTS = 10
+
 
 # =============================================================================
 # SECTION 2: DATABASE LAYER (SQLite)
@@ -137,27 +145,76 @@ DATABASE_PATH = f"{VOLUME_PATH}/app.db"
 # For high-write-throughput applications, consider PostgreSQL or similar.
 # =============================================================================
 
+import contextvars
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Final, Iterable, Optional, List, Tuple
 from datetime import datetime
 
+# Group commit window for Modal Volume commits (in seconds). Writes that land
+# within one window share a single volume.commit(); the window adapts toward
+# the measured commit latency, bounded by these limits.
+GROUP_COMMIT_MIN_INTERVAL = 0.01
+GROUP_COMMIT_MAX_INTERVAL = 0.5
+
+# A batch whose volume.commit() fails this many times in a row is given up on,
+# and callers waiting for it get VolumeCommitError. The writes stay in SQLite
+# and are retried with the next batch.
+GROUP_COMMIT_MAX_ATTEMPTS = 3
+
+# Longest a caller waits for its writes to reach the volume (in seconds), in
+# case volume.commit() hangs rather than failing
+FLUSH_TIMEOUT = 60.0
+
+# Maximum number of entries kept by the user and notes lookup caches
+LOOKUP_CACHE_SIZE = 512
+
+# Parsed statements kept per connection by the sqlite3 module. Statements are
+# cached by their SQL text, so queries always use fixed strings with
+# ? placeholders - never f-strings with values baked in.
+STATEMENT_CACHE_SIZE = 256
 
-@dataclass
+# Column type converters. Connections are opened with
+# detect_types=PARSE_DECLTYPES, so columns declared BOOLEAN come back as bool
+# and TIMESTAMP columns as datetime as rows are fetched - no per-field casts.
+# (These replace sqlite3's default TIMESTAMP converter, deprecated in 3.12.)
+sqlite3.register_converter("BOOLEAN", lambda value: bool(int(value)))
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+# The unit of work active in the current context (see Database.unit_of_work):
+# the set of Database objects written to, whose volume commit is deferred
+# until the unit ends. A ContextVar rather than a thread-local, because
+# FastHTML sets it up on the event loop but runs handlers on pool threads.
+_UNIT_OF_WORK: contextvars.ContextVar[Optional[set]] = contextvars.ContextVar("unit_of_work", default=None)
+
+# Database paths whose schema has already been set up in this process
+_SCHEMA_READY: set[str] = set()
+_SCHEMA_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class User:
     """
     Represents a user in our application.
 
     The dataclass decorator automatically generates __init__, __repr__, etc.
     This is a simple way to create structured data objects in Python.
+
+    slots=True stores fields in fixed slots instead of a per-instance
+    __dict__ (smaller objects, faster attribute access), and frozen=True
+    makes instances immutable, so cached User objects can be shared safely.
     """
     id: Optional[int]
     email: str
     name: str
     is_admin: bool
-    created_at: str
-    last_login: Optional[str]
+    created_at: datetime
+    last_login: Optional[datetime]
 
     def __ft__(self):
         """
@@ -175,6 +232,33 @@ class User:
         )
 
 
+def _user_row_factory(cursor: sqlite3.Cursor, row: tuple) -> User:
+    """
+    sqlite3 row factory that builds a User straight from a result tuple.
+
+    This skips creating an intermediate sqlite3.Row and looking up every
+    field by name. Columns must be in User field order; their values have
+    already been converted to bool/datetime by the registered converters.
+    """
+    return User(*row)
+
+
+class VolumeCommitError(Exception):
+    """Writes were saved to SQLite but could not be committed to the volume."""
+
+
+def _commit_pending(pending: set):
+    """Durably commit the volume for each Database written in a unit of work."""
+    try:
+        for database in pending:
+            database._mark_dirty()
+            database._flush_now()
+    finally:
+        # Cleared even on failure, so a failed flush isn't retried (and
+        # waited on) a second time for the same request
+        pending.clear()
+
+
 class Database:
     """
     Database abstraction layer for SQLite operations.
@@ -188,42 +272,356 @@ class Database:
     After writing to the database, we call volume.commit() to ensure
     changes are persisted. Without this, changes might be lost if the
     container shuts down before the automatic commit happens.
+
+    volume.commit() is a network round-trip, so writes don't call it
+    inline. Instead they wake a background thread which commits once for
+    every batch of writes that arrived together ("group commit").
     """
 
-    def __init__(self, db_path: str, volume_ref=None):
+    def __init__(self, db_path: str, volume_ref=None, pool_size: int = MAX_CONCURRENT_INPUTS):
         """
-        Initialize the database connection.
+        Initialize the database connection pool.
 
         Args:
             db_path: Path to the SQLite database file
             volume_ref: Reference to Modal Volume for committing changes
+            pool_size: Maximum number of pooled SQLite connections
         """
         self.db_path = db_path
         self.volume = volume_ref
+
+        # Connections are opened lazily (up to pool_size) and reused across
+        # calls, so each one keeps a warm page cache instead of starting cold.
+        # The pool is LIFO: the connection returned most recently (the one
+        # with the hottest cache) is handed out next, and extra connections
+        # opened for a burst sit idle at the bottom rather than rotating in.
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._pool_size = pool_size
+        self._opened = 0
+        self._pool_lock = threading.Lock()
+
+        # SQLite allows one write transaction at a time. Writers queue on
+        # this lock for the duration of their transaction only, instead of
+        # colliding inside SQLite and retrying on SQLITE_BUSY.
+        self._write_lock = threading.Lock()
+
+        # Group commit state. _write_seq counts writes and _committed_seq
+        # records the last write covered by a finished volume.commit().
+        # Each time the worker gives up on a batch it bumps _failures and
+        # records the batch's last write (_failed_seq) and the exception.
+        self._dirty_event = threading.Event()
+        self._commit_cond = threading.Condition()
+        self._write_seq = 0
+        self._committed_seq = 0
+        self._failures = 0
+        self._failed_seq = 0
+        self._commit_error: Optional[Exception] = None
+        self._commit_interval = GROUP_COMMIT_MIN_INTERVAL
+        if self.volume:
+            threading.Thread(target=self._commit_worker, name="volume-commit", daemon=True).start()
+
+        # The allow-list is small and only changes when an admin edits it,
+        # so the whole table is kept in memory as a frozenset, loaded on
+        # first use and updated in place by every method that changes it.
+        self._allowed_emails: Optional[frozenset] = None
+        self._allowed_lock = threading.Lock()
+
+        # LRU caches for user lookups, keyed on the lowercased email and on
+        # the user id. Methods that change the users table clear both.
+        self._user_cache = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch_user_by_email)
+        self._user_id_cache = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch_user_by_id)
+
+        # Each user's notes, keyed on user id. add_note/delete_note evict
+        # that user's entry. _notes_generation counts evictions, so a read
+        # that raced one doesn't put stale rows back in the cache.
+        self._notes_cache: Dict[int, List[sqlite3.Row]] = {}
+        self._notes_generation = 0
+        self._notes_lock = threading.Lock()
+
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a new SQLite connection for the pool.
+
+        check_same_thread=False lets a pooled connection be reused by
+        whichever worker thread checks it out next. The PRAGMAs are applied
+        once here rather than on every query:
+
+        - WAL lets readers proceed while a write is in progress, and with
+          synchronous=NORMAL a commit needs no fsync of the main database.
+          WAL keeps -wal and -shm files next to the database; they live on
+          the same volume and are included in volume.commit().
+        - mmap_size lets SQLite read pages straight from a memory map.
+        - With a volume, the commit worker checkpoints the WAL before each
+          volume.commit() (see _checkpoint), so automatic checkpoints are
+          turned off: otherwise whichever request's commit crossed the
+          1000-page threshold would do that copying work inline.
+
+        isolation_level=None turns off the sqlite3 module's implicit
+        transactions: each read runs as its own short statement, and
+        _get_connection(write=True) opens write transactions explicitly.
+
+        Because pooled connections live for the whole process, their
+        statement cache means repeated queries skip SQLite's parser and
+        query planner.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dict-like objects
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=134217728")  # 128 MiB
+        conn.execute("PRAGMA cache_size=-20000")  # 20 MiB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if self.volume:
+            conn.execute("PRAGMA wal_autocheckpoint=0")
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Take a connection from the pool, opening a new one if allowed."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if self._opened < self._pool_size:
+                self._opened += 1
+                open_new = True
+            else:
+                open_new = False
+
+        if open_new:
+            try:
+                return self._connect()
+            except Exception:
+                with self._pool_lock:
+                    self._opened -= 1
+                raise
+
+        # Pool is at capacity - wait for another caller to return one
+        return self._pool.get()
+
+    def warm(self):
+        """
+        Open every pooled connection and load the allow-list up front.
+
+        Called once at container start (see create_app) so the first
+        requests don't pay for opening connections, reading the schema and
+        running the allow-list query. The connections are all checked out
+        together, so each one is a separate connection rather than the same
+        one reused. PRAGMA optimize lets SQLite refresh any planner
+        statistics it considers stale; it is usually a no-op.
+        """
+        conns = [self._checkout() for _ in range(self._pool_size)]
+        try:
+            for conn in conns:
+                conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+                conn.execute("PRAGMA optimize")
+        finally:
+            for conn in conns:
+                self._pool.put(conn)
+        self._allowed_email_set()
+
     @contextmanager
-    def _get_connection(self):
+    def _get_connection(self, write: bool = False):
         """
-        Context manager for database connections.
+        Context manager for pooled database connections.
+
+        The connection is returned to the pool afterwards instead of being
+        closed. Pass write=True from methods that modify data so that the
+        Modal Volume is committed; read-only callers skip that step. Even
+        for writers, the volume is only committed if the block actually
+        changed rows (e.g. an INSERT OR IGNORE that ignored is a no-op).
 
-        Using a context manager ensures connections are properly closed,
-        even if an exception occurs. This prevents resource leaks.
+        Writers run inside BEGIN IMMEDIATE, which takes SQLite's write lock
+        up front. A transaction that started as a read and later tried to
+        write could otherwise fail with SQLITE_BUSY halfway through.
 
         Example:
             with self._get_connection() as conn:
                 conn.execute("SELECT * FROM users")
+
+            with self._get_connection(write=True) as conn:
+                conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return rows as dict-like objects
+        conn = self._checkout()
+        if write:
+            self._write_lock.acquire()
+        changes_before = conn.total_changes
         try:
+            if write:
+                conn.execute("BEGIN IMMEDIATE")
             yield conn
             conn.commit()
-            # Commit changes to the Modal Volume
-            if self.volume:
+            # Schedule a (batched) commit of the changes to the Modal Volume,
+            # or leave it to the enclosing unit of work
+            if write and self.volume and conn.total_changes != changes_before:
+                unit = _UNIT_OF_WORK.get()
+                if unit is not None:
+                    unit.add(self)
+                else:
+                    self._mark_dirty()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            if write:
+                self._write_lock.release()
+            self._pool.put(conn)
+
+    @staticmethod
+    def _user_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        Create a cursor whose rows come back as User objects.
+
+        The row factory is set on this cursor only, so the pooled
+        connection keeps returning sqlite3.Row for everything else.
+        Queries must select the columns in User field order.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = _user_row_factory
+        return cursor
+
+    def _mark_dirty(self):
+        """Record a write and wake the group commit worker."""
+        with self._commit_cond:
+            self._write_seq += 1
+        self._dirty_event.set()
+
+    def _commit_worker(self):
+        """
+        Background loop that commits the Modal Volume for batches of writes.
+
+        After being woken it waits for the current batching window, so that
+        concurrent writers can join, then issues one volume.commit(). The
+        window follows the average commit latency, similar to the adaptive
+        transaction batching in Linux's jbd2 journal.
+
+        A failed commit is retried up to GROUP_COMMIT_MAX_ATTEMPTS times.
+        After that the batch is marked failed, which wakes its waiters with
+        VolumeCommitError, and the worker goes back to waiting: the next
+        write or flush retries everything not yet committed.
+        """
+        attempts = 0
+        while True:
+            self._dirty_event.wait()
+            time.sleep(self._commit_interval)
+            self._dirty_event.clear()
+
+            with self._commit_cond:
+                target = self._write_seq
+                if target == self._committed_seq:
+                    continue
+
+            started = time.monotonic()
+            try:
+                self._checkpoint()
                 self.volume.commit()
+            except Exception as e:
+                attempts += 1
+                if attempts < GROUP_COMMIT_MAX_ATTEMPTS:
+                    print(f"WARNING: volume commit failed, retrying: {e}")
+                    time.sleep(GROUP_COMMIT_MAX_INTERVAL)
+                    self._dirty_event.set()
+                    continue
+                print(f"ERROR: volume commit failed {attempts} times, giving up on this batch: {e}")
+                attempts = 0
+                with self._commit_cond:
+                    self._failures += 1
+                    self._failed_seq = target
+                    self._commit_error = e
+                    self._commit_cond.notify_all()
+                continue
+            attempts = 0
+            elapsed = time.monotonic() - started
+
+            self._commit_interval = min(
+                max((self._commit_interval + elapsed) / 2, GROUP_COMMIT_MIN_INTERVAL),
+                GROUP_COMMIT_MAX_INTERVAL,
+            )
+            with self._commit_cond:
+                self._committed_seq = target
+                self._commit_cond.notify_all()
+
+    def _checkpoint(self):
+        """
+        Copy committed WAL frames back into the main database file.
+
+        Run before each volume.commit() so the snapshot is mostly the
+        database file itself rather than a long WAL. PASSIVE never waits
+        on or blocks readers and writers that are using the pool.
+        """
+        conn = self._checkout()
+        try:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
         finally:
-            conn.close()
+            self._pool.put(conn)
+
+    def _flush_now(self, timeout: float = FLUSH_TIMEOUT):
+        """
+        Block until every write made so far is committed to the volume.
+
+        Use this when a caller needs durability before returning. Modal also
+        commits attached volumes when the container shuts down.
+
+        Raises VolumeCommitError if the commit worker gives up on the batch
+        holding these writes, or if they aren't committed within timeout
+        seconds, so callers fail instead of hanging.
+        """
+        if not self.volume:
+            return
+        with self._commit_cond:
+            target = self._write_seq
+            if self._committed_seq >= target:
+                return
+            # Only a batch given up on while we wait counts; the worker
+            # retries older failures as part of the next batch.
+            failures = self._failures
+            self._dirty_event.set()
+            done = self._commit_cond.wait_for(
+                lambda: self._committed_seq >= target
+                or (self._failures > failures and self._failed_seq >= target),
+                timeout=timeout,
+            )
+            if self._committed_seq >= target:
+                return
+            if done:
+                raise VolumeCommitError("volume commit failed") from self._commit_error
+            raise VolumeCommitError(f"volume commit did not finish within {timeout:g}s")
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Defer the volume commit for every write in the block to its end.
+
+        The writes still commit to SQLite as they happen, so they are
+        visible in-process straight away. Only the Modal Volume commit is
+        deferred: on exit a single group commit runs, and the block waits
+        for it, so its writes are durable once the block returns. Nested
+        units fold into the outermost one.
+
+        Example:
+            with db.unit_of_work():
+                db.add_note(user_id, "first")
+                db.add_note(user_id, "second")  # one volume commit for both
+        """
+        if _UNIT_OF_WORK.get() is not None:
+            yield
+            return
+        pending = set()
+        token = _UNIT_OF_WORK.set(pending)
+        try:
+            yield
+        finally:
+            _UNIT_OF_WORK.reset(token)
+            _commit_pending(pending)
 
     def _init_db(self):
         """
@@ -231,9 +629,22 @@ class Database:
 
         Creates tables if they don't exist. This is idempotent - safe to
         call multiple times without side effects.
+
+        The schema work only runs once per database path per process, so
+        creating further Database objects for the same file is cheap.
         """
-        with self._get_connection() as conn:
-            # Users table - stores authorized users
+        with _SCHEMA_LOCK:
+            if self.db_path in _SCHEMA_READY:
+                return
+            self._create_schema()
+            _SCHEMA_READY.add(self.db_path)
+
+    def _create_schema(self):
+        """Create tables and indexes; called once per path by _init_db()."""
+        with self._get_connection(write=True) as conn:
+            # Users table - stores authorized users. Emails here and in
+            # allowed_emails are always stored lowercase, so lookups are a
+            # plain "email = ?" probe of the UNIQUE index.
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -267,40 +678,80 @@ class Database:
                 )
             """)
 
+            # Serves "WHERE user_id = ? ORDER BY created_at DESC" as a
+            # single index range scan, with no separate sort step
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_notes_user_created ON notes(user_id, created_at DESC)"
+            )
+
+            # Refresh query planner statistics. analysis_limit caps how many
+            # index rows ANALYZE samples, so this stays cheap on large tables.
+            conn.execute("PRAGMA analysis_limit=400")
+            conn.execute("ANALYZE")
+
     # -------------------------------------------------------------------------
     # USER MANAGEMENT METHODS
     # -------------------------------------------------------------------------
 
     def is_email_allowed(self, email: str) -> bool:
-        """Check if an email is in the allowed list."""
-        with self._get_connection() as conn:
-            result = conn.execute(
-                "SELECT 1 FROM allowed_emails WHERE LOWER(email) = LOWER(?)",
-                (email,)
-            ).fetchone()
-            return result is not None
+        """Check if an email is in the allowed list (cached, no SQL)."""
+        return email.lower() in self._allowed_email_set()
+
+    def _allowed_email_set(self) -> frozenset:
+        """
+        Return the cached allow-list, loading it with one query if needed.
+
+        The query runs while holding _allowed_lock, and writers update the
+        set under the same lock after their transaction commits, so a load
+        that raced with a write can never leave a stale set behind.
+        """
+        allowed = self._allowed_emails
+        if allowed is not None:
+            return allowed
+        with self._allowed_lock:
+            if self._allowed_emails is None:
+                with self._get_connection() as conn:
+                    rows = conn.execute("SELECT email FROM allowed_emails").fetchall()
+                self._allowed_emails = frozenset(row["email"] for row in rows)
+            return self._allowed_emails
+
+    def _update_allowed_emails(self, added: Iterable[str] = (), removed: Iterable[str] = ()):
+        """Apply a committed change to the cached allow-list, if it is loaded."""
+        with self._allowed_lock:
+            if self._allowed_emails is not None:
+                self._allowed_emails = self._allowed_emails.union(added).difference(removed)
 
     def add_allowed_email(self, email: str, added_by: str = "system"):
         """Add an email to the allowed list."""
-        with self._get_connection() as conn:
-            conn.execute(
+        self.add_allowed_emails([email], added_by=added_by)
+
+    def add_allowed_emails(self, emails: Iterable[str], added_by: str = "system"):
+        """
+        Add several emails to the allowed list at once.
+
+        executemany() runs every INSERT in one transaction on one pooled
+        connection, so importing N emails costs a single commit instead of N.
+        """
+        emails = [email.lower() for email in emails]
+        with self._get_connection(write=True) as conn:
+            conn.executemany(
                 "INSERT OR IGNORE INTO allowed_emails (email, added_by) VALUES (?, ?)",
-                (email.lower(), added_by)
+                ((email, added_by) for email in emails)
             )
+        self._update_allowed_emails(added=emails)
 
     def remove_allowed_email(self, email: str):
         """Remove an email from the allowed list."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             conn.execute(
-                "DELETE FROM allowed_emails WHERE LOWER(email) = LOWER(?)",
-                (email,)
+                "DELETE FROM allowed_emails WHERE email = ?",
+                (email.lower(),)
             )
+        self._update_allowed_emails(removed=[email.lower()])
 
     def get_allowed_emails(self) -> List[str]:
-        """Get all allowed emails."""
-        with self._get_connection() as conn:
-            rows = conn.execute("SELECT email FROM allowed_emails").fetchall()
-            return [row["email"] for row in rows]
+        """Get all allowed emails, sorted (served from the cached set)."""
+        return sorted(self._allowed_email_set())
 
     def get_or_create_user(self, email: str, name: str) -> Optional[User]:
         """
@@ -309,120 +760,190 @@ class Database:
         This is called during OAuth login. If the user exists, we update
         their last_login time. If not, we create a new user record.
 
-        Returns None if the email is not in the allowed list.
+        Both cases are a single UPSERT statement. The EXISTS check against
+        allowed_emails runs inside that same statement, so a login costs
+        one round-trip to SQLite and at most one volume commit.
+
+        Returns None if the email is not in the allowed list. Emails that
+        aren't in the cached allow-list are turned away before taking the
+        write lock; the EXISTS check stays as the authoritative one.
         """
         if not self.is_email_allowed(email):
             return None
 
-        with self._get_connection() as conn:
-            # Try to get existing user
-            row = conn.execute(
-                "SELECT * FROM users WHERE LOWER(email) = LOWER(?)",
-                (email,)
+        with self._get_connection(write=True) as conn:
+            user = self._user_cursor(conn).execute(
+                """
+                INSERT INTO users (email, name, last_login)
+                SELECT ?, ?, CURRENT_TIMESTAMP
+                WHERE EXISTS (SELECT 1 FROM allowed_emails WHERE email = ?)
+                ON CONFLICT(email) DO UPDATE SET last_login = CURRENT_TIMESTAMP
+                RETURNING id, email, name, is_admin, created_at, last_login
+                """,
+                (email.lower(), name, email.lower())
             ).fetchone()
 
-            if row:
-                # Update last login time
-                conn.execute(
-                    "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?",
-                    (row["id"],)
-                )
-                return User(
-                    id=row["id"],
-                    email=row["email"],
-                    name=row["name"],
-                    is_admin=bool(row["is_admin"]),
-                    created_at=row["created_at"],
-                    last_login=datetime.now().isoformat()
-                )
-            else:
-                # Create new user
-                cursor = conn.execute(
-                    "INSERT INTO users (email, name) VALUES (?, ?)",
-                    (email.lower(), name)
-                )
-                return User(
-                    id=cursor.lastrowid,
-                    email=email.lower(),
-                    name=name,
-                    is_admin=False,
-                    created_at=datetime.now().isoformat(),
-                    last_login=datetime.now().isoformat()
-                )
+        self._clear_user_caches()
+
+        # None means the allow-list check failed and nothing was written
+        return user
 
     def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get a user by their email address."""
+        """Get a user by their email address (cached)."""
+        return self._user_cache(email.lower())
+
+    def _fetch_user_by_email(self, email: str) -> Optional[User]:
+        """Query a user by email; use get_user_by_email() instead."""
         with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM users WHERE LOWER(email) = LOWER(?)",
+            return self._user_cursor(conn).execute(
+                "SELECT id, email, name, is_admin, created_at, last_login "
+                "FROM users WHERE email = ?",
                 (email,)
             ).fetchone()
 
-            if row:
-                return User(
-                    id=row["id"],
-                    email=row["email"],
-                    name=row["name"],
-                    is_admin=bool(row["is_admin"]),
-                    created_at=row["created_at"],
-                    last_login=row["last_login"]
-                )
-            return None
+    def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """Get a user by their id (cached)."""
+        return self._user_id_cache(user_id)
+
+    def _fetch_user_by_id(self, user_id: int) -> Optional[User]:
+        """Query a user by id; use get_user_by_id() instead."""
+        with self._get_connection() as conn:
+            return self._user_cursor(conn).execute(
+                "SELECT id, email, name, is_admin, created_at, last_login "
+                "FROM users WHERE id = ?",
+                (user_id,)
+            ).fetchone()
+
+    def _clear_user_caches(self):
+        """Forget cached users after a change to the users table."""
+        self._user_cache.cache_clear()
+        self._user_id_cache.cache_clear()
 
     def get_all_users(self) -> List[User]:
         """Get all users in the system."""
         with self._get_connection() as conn:
-            rows = conn.execute("SELECT * FROM users ORDER BY created_at DESC").fetchall()
-            return [
-                User(
-                    id=row["id"],
-                    email=row["email"],
-                    name=row["name"],
-                    is_admin=bool(row["is_admin"]),
-                    created_at=row["created_at"],
-                    last_login=row["last_login"]
-                )
-                for row in rows
-            ]
+            return self._user_cursor(conn).execute(
+                "SELECT id, email, name, is_admin, created_at, last_login "
+                "FROM users ORDER BY created_at DESC"
+            ).fetchall()
+
+    def get_admin_snapshot(self) -> Tuple[List[User], List[str]]:
+        """
+        Get everything the admin dashboard lists: (users, allowed emails).
+
+        Users come from one query on one pooled connection; the allow-list
+        is already held in memory, so it costs no second statement.
+        """
+        return self.get_all_users(), self.get_allowed_emails()
+
+    def get_counts(self) -> Dict[str, int]:
+        """Count users and allowed emails with a single statement."""
+        with self._get_connection() as conn:
+            users, allowed_emails = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM users), (SELECT COUNT(*) FROM allowed_emails)"
+            ).fetchone()
+        return {"users": users, "allowed_emails": allowed_emails}
 
     def set_admin(self, email: str, is_admin: bool):
         """Set or remove admin privileges for a user."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=True) as conn:
             conn.execute(
-                "UPDATE users SET is_admin = ? WHERE LOWER(email) = LOWER(?)",
-                (is_admin, email)
+                "UPDATE users SET is_admin = ? WHERE email = ?",
+                (is_admin, email.lower())
             )
+        self._clear_user_caches()
 
     # -------------------------------------------------------------------------
     # NOTES METHODS (Example app functionality)
     # -------------------------------------------------------------------------
 
-    def add_note(self, user_id: int, content: str) -> int:
-        """Add a new note for a user."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "INSERT INTO notes (user_id, content) VALUES (?, ?)",
+    def add_note(self, user_id: int, content: str) -> sqlite3.Row:
+        """
+        Add a new note for a user and return the stored row.
+
+        RETURNING hands back the id and the created_at that SQLite filled
+        in, in the same shape as get_notes() rows, so callers can render
+        the note without a second query or a clock of their own.
+        """
+        with self._get_connection(write=True) as conn:
+            note = conn.execute(
+                "INSERT INTO notes (user_id, content) VALUES (?, ?) "
+                "RETURNING id, user_id, content, created_at",
                 (user_id, content)
-            )
-            return cursor.lastrowid
+            ).fetchone()
+        self._invalidate_notes(user_id)
+        return note
+
+    def get_notes(self, user_id: int) -> List[sqlite3.Row]:
+        """
+        Get all notes for a user (cached; treat the list as read-only).
+
+        sqlite3.Row already supports note["content"] style access, so rows
+        are returned as-is instead of being copied into dicts.
+        """
+        with self._notes_lock:
+            notes = self._notes_cache.get(user_id)
+            if notes is not None:
+                return notes
+            generation = self._notes_generation
 
-    def get_notes(self, user_id: int) -> List[dict]:
-        """Get all notes for a user."""
         with self._get_connection() as conn:
-            rows = conn.execute(
+            notes = conn.execute(
                 "SELECT * FROM notes WHERE user_id = ? ORDER BY created_at DESC",
                 (user_id,)
             ).fetchall()
-            return [dict(row) for row in rows]
 
-    def delete_note(self, note_id: int, user_id: int) -> bool:
-        """Delete a note (only if it belongs to the user)."""
+        with self._notes_lock:
+            if self._notes_generation == generation:
+                if len(self._notes_cache) >= LOOKUP_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._notes_cache[next(iter(self._notes_cache))]
+                self._notes_cache[user_id] = notes
+        return notes
+
+    def get_recent_notes(self, user_id: int, limit: int = 3) -> Tuple[int, List[sqlite3.Row]]:
+        """
+        Get a user's total note count and their most recent notes.
+
+        If the user's full list is already cached it is simply sliced.
+        Otherwise one query returns both: COUNT(*) OVER () is computed over
+        all matching rows before LIMIT applies, so only `limit` rows are
+        read and decoded instead of every note the user has.
+        """
+        with self._notes_lock:
+            notes = self._notes_cache.get(user_id)
+        if notes is not None:
+            return len(notes), notes[:limit]
+
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM notes WHERE id = ? AND user_id = ?",
+            rows = conn.execute(
+                "SELECT COUNT(*) OVER () AS total, id, content, created_at "
+                "FROM notes WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
+                (user_id, limit)
+            ).fetchall()
+        return (rows[0]["total"] if rows else 0), rows
+
+    def _invalidate_notes(self, user_id: int):
+        """Drop a user's cached notes after a change to them."""
+        with self._notes_lock:
+            self._notes_generation += 1
+            self._notes_cache.pop(user_id, None)
+
+    def delete_note(self, note_id: int, user_id: int) -> bool:
+        """
+        Delete a note (only if it belongs to the user).
+
+        The ownership check is part of the DELETE itself, and RETURNING
+        tells us whether a row was removed without a second statement.
+        """
+        with self._get_connection(write=True) as conn:
+            deleted = conn.execute(
+                "DELETE FROM notes WHERE id = ? AND user_id = ? RETURNING id",
                 (note_id, user_id)
-            )
-            return cursor.rowcount > 0
+            ).fetchone()
+        if deleted is not None:
+            self._invalidate_notes(user_id)
+        return deleted is not None
 
 
 # =============================================================================
@@ -440,6 +961,9 @@ class Database:
 # - HTMX: Update parts of the page without full reloads
 # =============================================================================
 
+# Rows rendered and sent per chunk when stream_page() streams a long list
+STREAM_CHUNK_ROWS = 100
+
 def create_app():
     """
     Factory function to create the FastHTML application.
@@ -456,9 +980,25 @@ def create_app():
         Div, H1, H2, H3, P, A, Button, Form, Input, Label,
         Nav, Main, Header, Footer, Section, Article,
         Ul, Li, Span, Small, Strong, Textarea,
-        RedirectResponse
+        RedirectResponse, HTMLResponse, Response, NotStr, to_xml
     )
+    from starlette.responses import StreamingResponse
     from fasthtml.oauth import GoogleAppClient, OAuth
+    import base64
+    import gzip
+    from collections.abc import Iterator
+    from itertools import islice
+    import hashlib
+    import hmac
+    import json
+    import orjson
+    from html import escape
+    from urllib.parse import quote
+    from starlette.concurrency import run_in_threadpool
+    from starlette.datastructures import MutableHeaders
+    from starlette.middleware import Middleware
+    from starlette.middleware.sessions import SessionMiddleware
+    from starlette.requests import HTTPConnection
 
     # -------------------------------------------------------------------------
     # INITIALIZE DATABASE
@@ -480,6 +1020,10 @@ def create_app():
     if initial_admin:
         db.add_allowed_email(initial_admin, added_by="system")
 
+    # Open the connection pool and load the allow-list now, while the
+    # container is starting, rather than on the first requests it serves.
+    db.warm()
+
     # -------------------------------------------------------------------------
     # OAUTH CONFIGURATION
     # -------------------------------------------------------------------------
@@ -546,6 +1090,12 @@ def create_app():
     .mt-1 { margin-top: 1rem; }
     """
 
+    # The CSS is served from its own route (see stylesheet() below) instead
+    # of being inlined into every page. Its URL contains a hash of the CSS,
+    # so browsers can cache it forever: any edit changes the URL.
+    css_version = hashlib.sha256(custom_css.encode()).hexdigest()[:12]
+    css_href = f"/styles/{css_version}"
+
     hdrs = (
         Meta(charset="utf-8"),
         Meta(name="viewport", content="width=device-width, initial-scale=1"),
@@ -561,6 +1111,152 @@ def create_app():
         secret_key=os.environ.get("SESSION_SECRET", "dev-secret-change-in-production"),
     )
 
+    # -------------------------------------------------------------------------
+    # SESSION COOKIES
+    # -------------------------------------------------------------------------
+    # The session (who is logged in) travels in a cookie on every request.
+    # Starlette's default cookie is base64-encoded JSON signed with
+    # itsdangerous. We swap in a more compact format:
+    #
+    #     base64url(compact JSON) . issued-at . base64url(HMAC-SHA256)
+    #
+    # Everything is encoded once, without padding. The cookie is only re-sent
+    # when the session's contents actually change, or when it is old enough
+    # to need refreshing before max_age expires.
+    # -------------------------------------------------------------------------
+
+    def b64encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    def b64decode(text: str) -> bytes:
+        return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+    class SignedCookieSessionMiddleware:
+        """Drop-in replacement for Starlette's SessionMiddleware."""
+
+        def __init__(self, app, secret_key, session_cookie="session", max_age=14 * 24 * 60 * 60,
+                     path="/", same_site="lax", https_only=False, domain=None, **kwargs):
+            self.app = app
+            self.key = str(secret_key).encode()
+            self.session_cookie = session_cookie
+            self.max_age = max_age
+            self.security_flags = f"path={path}; httponly; samesite={same_site}"
+            if https_only:
+                self.security_flags += "; secure"
+            if domain is not None:
+                self.security_flags += f"; domain={domain}"
+
+        def sign(self, message: str) -> str:
+            return b64encode(hmac.new(self.key, message.encode(), hashlib.sha256).digest())
+
+        def load(self, cookie: str):
+            """Return (payload, issued_at) for a valid cookie, else None."""
+            try:
+                payload, issued, signature = cookie.split(".")
+                # Compare bytes: compare_digest raises TypeError for str
+                # arguments containing non-ASCII characters, and the cookie
+                # is whatever the client sent.
+                expected = self.sign(f"{payload}.{issued}").encode()
+                if not hmac.compare_digest(signature.encode(), expected):
+                    return None
+                if self.max_age and time.time() - int(issued) > self.max_age:
+                    return None
+                return payload, int(issued)
+            except ValueError:
+                return None
+
+        async def __call__(self, scope, receive, send):
+            if scope["type"] not in ("http", "websocket"):
+                return await self.app(scope, receive, send)
+
+            loaded = None
+            cookie = HTTPConnection(scope).cookies.get(self.session_cookie)
+            if cookie:
+                loaded = self.load(cookie)
+            initial_json, issued = "", 0
+            scope["session"] = {}
+            if loaded:
+                try:
+                    initial_json = b64decode(loaded[0]).decode()
+                    scope["session"] = json.loads(initial_json)
+                    issued = loaded[1]
+                except ValueError:
+                    initial_json = ""
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    session = scope["session"]
+                    headers = MutableHeaders(scope=message)
+                    if session:
+                        data = json.dumps(session, separators=(",", ":"))
+                        stale = self.max_age and time.time() - issued > self.max_age / 2
+                        if data != initial_json or stale:
+                            now = int(time.time())
+                            payload = f"{b64encode(data.encode())}.{now}"
+                            max_age = f"Max-Age={self.max_age}; " if self.max_age else ""
+                            headers.append(
+                                "Set-Cookie",
+                                f"{self.session_cookie}={payload}.{self.sign(payload)}; "
+                                f"{max_age}{self.security_flags}",
+                            )
+                    elif cookie:
+                        # The session was cleared (or the cookie was invalid)
+                        headers.append(
+                            "Set-Cookie",
+                            f"{self.session_cookie}=null; expires=Thu, 01 Jan 1970 00:00:00 GMT; "
+                            f"{self.security_flags}",
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+    # fast_app() always installs Starlette's SessionMiddleware; replace it
+    # with ours, keeping the same settings (cookie name, max_age, ...)
+    fasthtml_app.user_middleware = [
+        Middleware(SignedCookieSessionMiddleware, *m.args, **m.kwargs)
+        if m.cls is SessionMiddleware else m
+        for m in fasthtml_app.user_middleware
+    ]
+
+    # -------------------------------------------------------------------------
+    # ONE VOLUME COMMIT PER REQUEST
+    # -------------------------------------------------------------------------
+    # Every HTTP request runs as a database unit of work. However many
+    # Database methods a request calls, its writes are committed to the
+    # volume once, just before the response is sent. Concurrent requests
+    # share the same group commit.
+    # -------------------------------------------------------------------------
+
+    class UnitOfWorkMiddleware:
+        """ASGI middleware that wraps each HTTP request in a unit of work."""
+
+        def __init__(self, app):
+            self.app = app
+
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                return await self.app(scope, receive, send)
+
+            pending = set()
+            token = _UNIT_OF_WORK.set(pending)
+
+            async def send_when_durable(message):
+                # Commit before the response starts, so any write the client
+                # sees acknowledged is already on the volume
+                if message["type"] == "http.response.start" and pending:
+                    await run_in_threadpool(_commit_pending, pending)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_when_durable)
+            finally:
+                _UNIT_OF_WORK.reset(token)
+                # Writes made after the response started (e.g. background tasks)
+                if pending:
+                    await run_in_threadpool(_commit_pending, pending)
+
+    fasthtml_app.add_middleware(UnitOfWorkMiddleware)
+
     # -------------------------------------------------------------------------
     # CUSTOM OAUTH HANDLER
     # -------------------------------------------------------------------------
@@ -579,10 +1275,16 @@ def create_app():
         4. If not allowed, we show an error page
         """
 
-        def get_auth(self, info, ident, session, state):
+        async def get_auth(self, info, ident, session, state):
             """
             Called after successful OAuth authentication.
 
+            FastHTML runs ordinary (sync) route handlers in a thread pool,
+            but the OAuth redirect handler awaits this method on the event
+            loop itself. The blocking SQLite call is therefore moved to the
+            thread pool so it can't stall other requests. (FastHTML only
+            awaits get_auth from 0.12.41 on, hence the version floor.)
+
             Args:
                 info: User info from Google (email, name, picture, etc.)
                 ident: Unique identifier from the OAuth provider
@@ -600,14 +1302,17 @@ def create_app():
                 return RedirectResponse("/error?msg=Email+not+verified", status_code=303)
 
             # Check if user is allowed and create/update their record
-            user = db.get_or_create_user(email, name)
+            user = await run_in_threadpool(db.get_or_create_user, email, name)
 
             if user:
-                # Store user info in session
-                session["user_email"] = user.email
-                session["user_name"] = user.name
-                session["user_id"] = user.id
-                session["is_admin"] = user.is_admin
+                # The session stores only the user's id; the rest is looked
+                # up per request through Database's cache, which keeps the
+                # cookie small. The cache is per container: a change made
+                # elsewhere (make_admin runs as its own Modal function) shows
+                # up once the entry is evicted, the container restarts, or
+                # the user logs in again.
+                if session.get("uid") != user.id:
+                    session["uid"] = user.id
                 return RedirectResponse("/", status_code=303)
             else:
                 return RedirectResponse(
@@ -616,8 +1321,11 @@ def create_app():
                 )
 
     # Initialize OAuth if credentials are available
+    # Pages reachable without logging in (the stylesheet is needed by /login)
+    public_paths = ["/redirect", "/error", "/login", r"/styles/\w+"]
+
     if oauth_client:
-        oauth = AppAuth(fasthtml_app, oauth_client)
+        oauth = AppAuth(fasthtml_app, oauth_client, skip=public_paths)
     else:
         oauth = None
 
@@ -625,66 +1333,65 @@ def create_app():
     # HELPER FUNCTIONS
     # -------------------------------------------------------------------------
 
-    def get_current_user(session) -> Optional[User]:
-        """Get the currently logged-in user from session."""
-        email = session.get("user_email")
-        if email:
-            return db.get_user_by_email(email)
-        return None
-
-    def require_auth(session):
-        """Check if user is authenticated, redirect to login if not."""
-        if not session.get("user_email"):
-            return RedirectResponse("/login", status_code=303)
-        return None
-
-    def require_admin(session):
-        """Check if user is admin, redirect with error if not."""
-        if not session.get("is_admin"):
-            return RedirectResponse("/error?msg=Admin+access+required", status_code=303)
-        return None
+    def current_user_from_session(session) -> Optional[User]:
+        """
+        Get the currently logged-in user from session.
 
-    def page_layout(title: str, *content, user=None):
+        get_auth stores just the user's id in the signed session cookie.
+        The User comes from db.get_user_by_id(), which is served from an
+        in-process LRU cache, so a request normally doesn't touch SQLite.
         """
-        Base layout template for all pages.
+        uid = session.get("uid")
+        if uid is None:
+            return None
+        return db.get_user_by_id(uid)
 
-        This is a reusable component that wraps page content with
-        consistent header, navigation, and footer.
+    def check_access(session, admin: bool = False) -> Tuple[Optional[RedirectResponse], Optional[User]]:
+        """
+        Check that a user is logged in (and, if admin=True, is an admin).
+
+        Returns (redirect, user): if redirect is not None the route should
+        return it straight away; otherwise user is the logged-in User.
 
-        FastHTML uses Python functions as components - just return
-        HTML elements and they'll be rendered properly.
+            redirect, user = check_access(session, admin=True)
+            if redirect:
+                return redirect
         """
-        nav_items = [Li(A("Home", href="/"))]
+        user = current_user_from_session(session)
+        if user is None:
+            return RedirectResponse("/login", status_code=303), None
+        if admin and not user.is_admin:
+            return RedirectResponse("/error?msg=Admin+access+required", status_code=303), None
+        return None, user
 
-        if user:
-            nav_items.extend([
-                Li(A("My Notes", href="/notes")),
-                Li(Span(f"👤 {user.name}", cls="text-muted")),
-            ])
-            if user.is_admin:
-                nav_items.append(Li(A("Admin", href="/admin")))
-            nav_items.append(Li(A("Logout", href="/logout")))
-        else:
-            nav_items.append(Li(A("Login", href="/login")))
+    # -------------------------------------------------------------------------
+    # PRE-RENDERED PAGE CHROME
+    # -------------------------------------------------------------------------
+    # The <head>, header, nav and footer are the same on every page, apart
+    # from the title and who is logged in. Rather than rebuilding (and
+    # re-rendering) that component tree on every request, each variant is
+    # rendered to HTML once, here, with placeholders marking the parts that
+    # change. Only the page content is rendered per request.
+    # -------------------------------------------------------------------------
 
-        return Html(
+    def render_page_shell(*nav_items):
+        """Render the page skeleton once and split it around the content slot."""
+        page = to_xml(Html(
             Head(
-                Title(f"{title} - StatefulModal"),
+                Title("__TITLE__ - StatefulModal"),
                 *hdrs,
-                Script(custom_css, type="text/css"),
-                # Inline the CSS properly
-                Link(rel="stylesheet", href="data:text/css," + custom_css.replace(" ", "%20").replace("\n", "%0A")),
+                Link(rel="stylesheet", href=css_href),
             ),
             Body(
                 Header(
                     Nav(
                         Ul(Li(Strong(A("StatefulModal", href="/")))),
-                        Ul(*nav_items),
+                        Ul(Li(A("Home", href="/")), *nav_items),
                         cls="container"
                     )
                 ),
                 Main(
-                    Div(*content, cls="container"),
+                    "__CONTENT__",
                     cls="container"
                 ),
                 Footer(
@@ -701,6 +1408,190 @@ def create_app():
                 ),
                 style="min-height: 100vh; display: flex; flex-direction: column;"
             )
+        ))
+        before, after = page.split("__CONTENT__")
+        return before, after
+
+    def user_nav(*admin_items):
+        """Nav items for a logged-in user; the name is filled in per request."""
+        return (
+            Li(A("My Notes", href="/notes")),
+            Li(Span("👤 __USERNAME__", cls="text-muted")),
+            *admin_items,
+            Li(A("Logout", href="/logout")),
+        )
+
+    # Keyed on the visitor: None when logged out, else their is_admin flag
+    page_shells = {
+        None: render_page_shell(Li(A("Login", href="/login"))),
+        False: render_page_shell(*user_nav()),
+        True: render_page_shell(*user_nav(Li(A("Admin", href="/admin")))),
+    }
+
+    def page_shell(title: str, user=None):
+        """Return the (before, after) chrome for a page, with placeholders filled."""
+        before, after = page_shells[user.is_admin if user else None]
+        before = before.replace("__TITLE__", escape(title), 1)
+        if user:
+            before = before.replace("__USERNAME__", escape(user.name), 1)
+        return before, after
+
+    def render_page(title: str, *content, user=None) -> str:
+        """Render a full page to HTML; see page_layout()."""
+        before, after = page_shell(title, user)
+        return before + to_xml(Div(*content, cls="container")) + after
+
+    def page_layout(title: str, *content, user=None):
+        """
+        Base layout template for all pages.
+
+        This is a reusable component that wraps page content with
+        consistent header, navigation, and footer.
+
+        The surrounding chrome comes pre-rendered from page_shells, so only
+        the content (plus the escaped title and user name) is rendered here.
+        """
+        return HTMLResponse(render_page(title, *content, user=user))
+
+    def stream_page(title: str, *content, user=None):
+        """
+        Like page_layout(), but streams the page as it is rendered.
+
+        The <head> and nav are sent straight away, so the browser can start
+        fetching CSS and scripts while the content is still being rendered.
+        A section built with streamed_rows() renders its rows a chunk at a
+        time as they are sent, so a long list never sits in memory as one
+        string. Used for the pages whose lists can grow long.
+        """
+        before, after = page_shell(title, user)
+
+        def chunks():
+            yield before + '<div class="container">'
+            for section in content:
+                if isinstance(section, Iterator):
+                    yield from section
+                else:
+                    yield to_xml(section)
+            yield "</div>" + after
+
+        return StreamingResponse(chunks(), media_type="text/html; charset=utf-8")
+
+    def streamed_rows(container, rows: Iterable[str]):
+        """
+        A stream_page() section whose rows are rendered while it is sent.
+
+        container is the section's component with __ROWS__ where the rows
+        go. The markup around that placeholder is sent as-is, and the rows
+        in between STREAM_CHUNK_ROWS at a time.
+        """
+        before, after = to_xml(container).split("__ROWS__", 1)
+        yield before
+        rows = iter(rows)
+        while batch := list(islice(rows, STREAM_CHUNK_ROWS)):
+            yield "".join(batch)
+        yield after
+
+    def static_page(html: str) -> Tuple[bytes, bytes]:
+        """
+        Prepare a page that never changes: (raw bytes, gzip-compressed bytes).
+
+        Compressing once at startup, at the highest level, means these
+        pages cost no compression work per request and ship about half the bytes.
+        """
+        raw = html.encode()
+        return raw, gzip.compress(raw, compresslevel=9)
+
+    def accepts_gzip(accept_encoding: str) -> bool:
+        """
+        Does an Accept-Encoding header allow a gzip response?
+
+        The header is a list like "gzip, deflate;q=0.5, br;q=0". A coding
+        with q=0 is an explicit refusal, x-gzip is an alias for gzip, and
+        "*" covers codings that aren't listed by name. A q-value that
+        doesn't parse (or is outside 0-1) counts as the default, q=1.
+        """
+        gzip_q = wildcard_q = None
+        for item in accept_encoding.split(","):
+            coding, _, params = item.partition(";")
+            coding = coding.strip().lower()
+            q = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 1.0
+                    if not 0.0 <= q <= 1.0:  # also catches nan
+                        q = 1.0
+            if coding in ("gzip", "x-gzip"):
+                gzip_q = q if gzip_q is None else max(gzip_q, q)
+            elif coding == "*":
+                wildcard_q = q
+        if gzip_q is not None:
+            return gzip_q > 0
+        return bool(wildcard_q)
+
+    def static_page_response(req, page: Tuple[bytes, bytes]):
+        """Send a static_page(), gzipped if the client accepts it."""
+        raw, compressed = page
+        headers = {"Vary": "Accept-Encoding"}
+        if accepts_gzip(req.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return HTMLResponse(compressed, headers=headers)
+        return HTMLResponse(raw, headers=headers)
+
+    # -------------------------------------------------------------------------
+    # ROW TEMPLATES
+    # -------------------------------------------------------------------------
+    # The notes lists and the admin page's user and email lists can run to
+    # hundreds of rows. Rather than building several component objects for
+    # every row, each row is a single str.format() of an HTML template, with
+    # every dynamic value passed through escape() exactly once. The rows are
+    # then already HTML: streamed_rows() sends them as they are, and NotStr
+    # keeps them from being escaped again inside a component.
+    # -------------------------------------------------------------------------
+
+    note_card_template = (
+        '<div class="note-card" id="note-{id}"><p>{content}</p>'
+        '<div style="display: flex; justify-content: space-between; align-items: center;">'
+        '<small class="text-muted">{created_at}</small>'
+        '<button hx-delete="/notes/{id}" hx-target="closest .note-card" hx-swap="outerHTML" '
+        'hx-confirm="Delete this note?" class="secondary outline" '
+        'style="padding: 0.25rem 0.5rem; font-size: 0.875rem;">🗑️ Delete</button>'
+        '</div></div>'
+    )
+
+    recent_note_template = (
+        '<div class="note-card"><p>{content}</p>'
+        '<small class="text-muted">{created_at}</small></div>'
+    )
+
+    user_row_template = (
+        '<div><strong>{name}</strong> ({email})'
+        '<small class="text-muted"> - Admin: {admin}</small>'
+        '<small class="text-muted"> - Last login: {last_login}</small></div>'
+    )
+
+    email_row_template = (
+        '<li id="email-{slug}">{email}'
+        '<button hx-delete="/admin/emails/{url}" hx-target="closest li" hx-swap="outerHTML" '
+        'hx-confirm="Remove {email} from allowed list?" class="secondary outline" '
+        'style="padding: 0 0.5rem; margin-left: 0.5rem;">×</button></li>'
+    )
+
+    @lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+    def email_row(email: str) -> str:
+        """
+        Render one allowed email with its remove button.
+
+        Cached per email: the allow-list barely changes, so each row (with
+        its DOM id slug, escaping and URL quoting) is only built once.
+        """
+        return email_row_template.format(
+            slug=escape(email.replace('@', '-at-').replace('.', '-dot-')),
+            email=escape(email),
+            url=escape(quote(email)),
         )
 
     # -------------------------------------------------------------------------
@@ -716,19 +1607,18 @@ def create_app():
     # -------------------------------------------------------------------------
 
     @rt("/")
-    def home(session):
+    def home(req, session):
         """
         Home page - shows different content based on login status.
 
         The 'session' parameter is automatically injected by FastHTML.
         It contains data stored in the user's encrypted session cookie.
         """
-        user = get_current_user(session)
+        user = current_user_from_session(session)
 
         if user:
             # Logged-in user sees their dashboard
-            notes = db.get_notes(user.id)
-            recent_notes = notes[:3]  # Show last 3 notes
+            note_count, recent_notes = db.get_recent_notes(user.id, limit=3)
 
             content = [
                 H1(f"Welcome back, {user.name}!"),
@@ -737,7 +1627,7 @@ def create_app():
                 Section(
                     H2("Quick Stats"),
                     Ul(
-                        Li(f"📝 You have {len(notes)} notes"),
+                        Li(f"📝 You have {note_count} notes"),
                         Li(f"📧 Logged in as {user.email}"),
                         Li(f"🔐 Admin: {'Yes' if user.is_admin else 'No'}"),
                     ),
@@ -747,44 +1637,48 @@ def create_app():
                 Section(
                     H2("Recent Notes"),
                     Div(
-                        *[
-                            Div(
-                                P(note["content"]),
-                                Small(note["created_at"], cls="text-muted"),
-                                cls="note-card"
+                        NotStr("".join(
+                            recent_note_template.format(
+                                content=escape(note["content"]),
+                                created_at=escape(str(note["created_at"])),
                             )
                             for note in recent_notes
-                        ] if recent_notes else [P("No notes yet. ", A("Create one!", href="/notes"))],
+                        )) if recent_notes else P("No notes yet. ", A("Create one!", href="/notes")),
                     ),
                     A("View all notes →", href="/notes", role="button"),
                     cls="mb-1"
                 ),
             ]
         else:
-            # Anonymous user sees landing page
-            content = [
-                H1("Welcome to StatefulModal"),
-                P("A template application demonstrating Modal + FastHTML + SQLite"),
+            # Anonymous user sees landing page (rendered once, below)
+            return static_page_response(req, anon_home_page)
 
-                Section(
-                    H2("Features"),
-                    Ul(
-                        Li("🚀 Serverless deployment with Modal"),
-                        Li("🎨 Modern UI with FastHTML + HTMX"),
-                        Li("💾 Persistent storage with SQLite + Modal Volumes"),
-                        Li("🔐 Secure authentication with Google OAuth"),
-                        Li("👥 User management with email whitelist"),
-                    ),
-                    cls="mb-1"
-                ),
+        return page_layout("Home", *content, user=user)
 
-                Div(
-                    A("Login with Google", href="/login", role="button"),
-                    cls="text-center"
-                ),
-            ]
+    # The landing page is identical for every anonymous visitor, so it is
+    # rendered (and compressed) once at startup and served as ready-made bytes.
+    anon_home_page = static_page(render_page(
+        "Home",
+        H1("Welcome to StatefulModal"),
+        P("A template application demonstrating Modal + FastHTML + SQLite"),
+
+        Section(
+            H2("Features"),
+            Ul(
+                Li("🚀 Serverless deployment with Modal"),
+                Li("🎨 Modern UI with FastHTML + HTMX"),
+                Li("💾 Persistent storage with SQLite + Modal Volumes"),
+                Li("🔐 Secure authentication with Google OAuth"),
+                Li("👥 User management with email whitelist"),
+            ),
+            cls="mb-1"
+        ),
 
-        return page_layout("Home", *content, user=user)
+        Div(
+            A("Login with Google", href="/login", role="button"),
+            cls="text-center"
+        ),
+    ))
 
     @rt("/login")
     def login(req, session):
@@ -793,7 +1687,7 @@ def create_app():
 
         If OAuth is not configured, shows setup instructions.
         """
-        user = get_current_user(session)
+        user = current_user_from_session(session)
         if user:
             return RedirectResponse("/", status_code=303)
 
@@ -812,28 +1706,32 @@ def create_app():
                 ),
             ]
         else:
-            content = [
-                H1("Login"),
-                Div(
-                    H3("⚠️ OAuth Not Configured"),
-                    P("To enable login, set up Google OAuth credentials:"),
-                    Ul(
-                        Li("Create a Google Cloud project"),
-                        Li("Enable the Google+ API"),
-                        Li("Create OAuth credentials"),
-                        Li("Add credentials to Modal secrets"),
-                    ),
-                    P(
-                        "See the ",
-                        A("README", href="https://github.com/your-repo"),
-                        " for detailed instructions."
-                    ),
-                    cls="flash-message"
-                ),
-            ]
+            return static_page_response(req, login_setup_page)
 
         return page_layout("Login", *content)
 
+    # Without OAuth the login page is static setup instructions
+    login_setup_page = static_page(render_page(
+        "Login",
+        H1("Login"),
+        Div(
+            H3("⚠️ OAuth Not Configured"),
+            P("To enable login, set up Google OAuth credentials:"),
+            Ul(
+                Li("Create a Google Cloud project"),
+                Li("Enable the Google+ API"),
+                Li("Create OAuth credentials"),
+                Li("Add credentials to Modal secrets"),
+            ),
+            P(
+                "See the ",
+                A("README", href="https://github.com/your-repo"),
+                " for detailed instructions."
+            ),
+            cls="flash-message"
+        ),
+    ))
+
     @rt("/error")
     def error(msg: str = "An error occurred"):
         """
@@ -842,15 +1740,20 @@ def create_app():
         The 'msg' parameter is automatically extracted from the query string.
         For example: /error?msg=Access+denied
         """
-        content = [
+        return HTMLResponse(render_error_page(msg))
+
+    @lru_cache(maxsize=128)
+    def render_error_page(msg: str) -> bytes:
+        """Render an error page; the handful of distinct messages are cached."""
+        return render_page(
+            "Error",
             H1("Error"),
             Div(
                 P(msg),
                 A("← Back to Home", href="/"),
                 cls="flash-message"
             ),
-        ]
-        return page_layout("Error", *content)
+        ).encode()
 
     # -------------------------------------------------------------------------
     # NOTES FEATURE (Protected Routes)
@@ -867,11 +1770,10 @@ def create_app():
         Shows all user's notes with forms to add/delete.
         Uses HTMX for dynamic updates without page reloads.
         """
-        redirect = require_auth(session)
+        redirect, user = check_access(session)
         if redirect:
             return redirect
 
-        user = get_current_user(session)
         user_notes = db.get_notes(user.id)
 
         content = [
@@ -896,39 +1798,28 @@ def create_app():
             ),
 
             # Notes list - this is updated by HTMX
-            Div(
-                *[note_card(note, user.id) for note in user_notes],
-                id="notes-list",
-                cls="mt-1"
+            streamed_rows(
+                Div("__ROWS__", id="notes-list", cls="mt-1"),
+                (note_card(note, user.id) for note in user_notes),
             ),
         ]
 
-        return page_layout("My Notes", *content, user=user)
+        return stream_page("My Notes", *content, user=user)
 
-    def note_card(note: dict, user_id: int):
+    def note_card(note: dict, user_id: int) -> str:
         """
         Component to render a single note.
 
         Includes a delete button that uses HTMX to remove the note
         without a full page reload.
+
+        Note lists can be long, so this fills in note_card_template (see
+        ROW TEMPLATES) instead of building a tree of components per note.
         """
-        return Div(
-            P(note["content"]),
-            Div(
-                Small(note["created_at"], cls="text-muted"),
-                Button(
-                    "🗑️ Delete",
-                    hx_delete=f"/notes/{note['id']}",
-                    hx_target="closest .note-card",
-                    hx_swap="outerHTML",
-                    hx_confirm="Delete this note?",
-                    cls="secondary outline",
-                    style="padding: 0.25rem 0.5rem; font-size: 0.875rem;",
-                ),
-                style="display: flex; justify-content: space-between; align-items: center;",
-            ),
-            cls="note-card",
-            id=f"note-{note['id']}"
+        return note_card_template.format(
+            id=note["id"],
+            content=escape(note["content"]),
+            created_at=escape(str(note["created_at"])),
         )
 
     @rt("/notes/add")
@@ -939,32 +1830,26 @@ def create_app():
         Returns just the HTML for the new note card, which HTMX
         inserts into the notes list.
         """
-        redirect = require_auth(session)
+        redirect, user = check_access(session)
         if redirect:
             return redirect
 
-        user = get_current_user(session)
-        note_id = db.add_note(user.id, content)
+        note = db.add_note(user.id, content)
 
         # Return the new note card for HTMX to insert
-        return note_card({
-            "id": note_id,
-            "content": content,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }, user.id)
+        return note_card(note, user.id)
 
-    @rt("/notes/{note_id}")
+    @rt("/notes/{note_id}", methods=["delete"])
     def delete_note(session, note_id: int):
         """
         Delete a note (DELETE handler).
 
         Returns empty string, causing HTMX to remove the element.
         """
-        redirect = require_auth(session)
+        redirect, user = check_access(session)
         if redirect:
             return redirect
 
-        user = get_current_user(session)
         db.delete_note(note_id, user.id)
 
         # Return empty - HTMX will remove the target element
@@ -980,144 +1865,138 @@ def create_app():
     @rt("/admin")
     def admin_page(session):
         """Admin dashboard for user management."""
-        redirect = require_auth(session)
-        if redirect:
-            return redirect
-        redirect = require_admin(session)
+        redirect, user = check_access(session, admin=True)
         if redirect:
             return redirect
 
-        user = get_current_user(session)
-        all_users = db.get_all_users()
-        allowed_emails = db.get_allowed_emails()
+        all_users, allowed_emails = db.get_admin_snapshot()
 
         content = [
             H1("Admin Dashboard"),
 
             # User management section
-            Section(
-                H2("Registered Users"),
-                Div(
-                    *[
-                        Div(
-                            Strong(u.name), f" ({u.email})",
-                            Small(f" - Admin: {'Yes' if u.is_admin else 'No'}", cls="text-muted"),
-                            Small(f" - Last login: {u.last_login or 'Never'}", cls="text-muted"),
-                        )
-                        for u in all_users
-                    ] if all_users else [P("No users registered yet.")],
+            streamed_rows(
+                Section(
+                    H2("Registered Users"),
+                    Div("__ROWS__"),
+                    cls="admin-section"
                 ),
-                cls="admin-section"
+                (
+                    user_row_template.format(
+                        name=escape(u.name),
+                        email=escape(u.email),
+                        admin="Yes" if u.is_admin else "No",
+                        last_login=escape(str(u.last_login or "Never")),
+                    )
+                    for u in all_users
+                ) if all_users else [to_xml(P("No users registered yet."))],
             ),
 
             # Email whitelist section
-            Section(
-                H2("Allowed Emails"),
-                P("Only users with these emails can log in:"),
-
-                # Add email form
-                Form(
-                    Input(
-                        name="email",
-                        type="email",
-                        placeholder="email@example.com",
-                        required=True,
+            streamed_rows(
+                Section(
+                    H2("Allowed Emails"),
+                    P("Only users with these emails can log in:"),
+
+                    # Add email form
+                    Form(
+                        Input(
+                            name="email",
+                            type="email",
+                            placeholder="email@example.com",
+                            required=True,
+                        ),
+                        Button("Add Email", type="submit"),
+                        hx_post="/admin/emails/add",
+                        hx_target="#email-list",
+                        hx_swap="beforeend",
+                        style="display: flex; gap: 0.5rem;",
                     ),
-                    Button("Add Email", type="submit"),
-                    hx_post="/admin/emails/add",
-                    hx_target="#email-list",
-                    hx_swap="beforeend",
-                    style="display: flex; gap: 0.5rem;",
-                ),
 
-                # Email list
-                Ul(
-                    *[
-                        Li(
-                            email,
-                            Button(
-                                "×",
-                                hx_delete=f"/admin/emails/{email}",
-                                hx_target="closest li",
-                                hx_swap="outerHTML",
-                                hx_confirm=f"Remove {email} from allowed list?",
-                                cls="secondary outline",
-                                style="padding: 0 0.5rem; margin-left: 0.5rem;",
-                            ),
-                            id=f"email-{email.replace('@', '-at-').replace('.', '-dot-')}",
-                        )
-                        for email in allowed_emails
-                    ],
-                    id="email-list"
+                    # Email list
+                    Ul("__ROWS__", id="email-list"),
+                    cls="admin-section"
                 ),
-                cls="admin-section"
+                (email_row(email) for email in allowed_emails),
             ),
         ]
 
-        return page_layout("Admin", *content, user=user)
+        return stream_page("Admin", *content, user=user)
 
     @rt("/admin/emails/add")
     def add_email(session, email: str):
         """Add an email to the allowed list."""
-        redirect = require_auth(session)
-        if redirect:
-            return redirect
-        redirect = require_admin(session)
+        redirect, user = check_access(session, admin=True)
         if redirect:
             return redirect
 
-        user = get_current_user(session)
         db.add_allowed_email(email, added_by=user.email)
 
-        email_id = email.replace('@', '-at-').replace('.', '-dot-')
-        return Li(
-            email,
-            Button(
-                "×",
-                hx_delete=f"/admin/emails/{email}",
-                hx_target="closest li",
-                hx_swap="outerHTML",
-                hx_confirm=f"Remove {email} from allowed list?",
-                cls="secondary outline",
-                style="padding: 0 0.5rem; margin-left: 0.5rem;",
-            ),
-            id=f"email-{email_id}",
-        )
+        return email_row(email)
 
-    @rt("/admin/emails/{email:path}")
+    @rt("/admin/emails/{email:path}", methods=["delete"])
     def remove_email(session, email: str):
         """Remove an email from the allowed list."""
-        redirect = require_auth(session)
-        if redirect:
-            return redirect
-        redirect = require_admin(session)
+        redirect, _ = check_access(session, admin=True)
         if redirect:
             return redirect
 
         db.remove_allowed_email(email)
         return ""
 
+    # -------------------------------------------------------------------------
+    # STATIC ASSETS
+    # -------------------------------------------------------------------------
+
+    @rt("/styles/{version}")
+    def stylesheet(version: str):
+        """
+        Serve the app's CSS with a long-lived cache header.
+
+        Pages link to css_href, which changes whenever the CSS does, so a
+        cached copy is never stale and browsers needn't re-request it.
+
+        Only the current version is served that way. Any other version (a
+        page rendered before a deploy, or a mistyped URL) is redirected to
+        it, uncached, so outdated CSS is never cached under a versioned URL.
+        """
+        if version != css_version:
+            return RedirectResponse(css_href, status_code=302, headers={"Cache-Control": "no-store"})
+        return Response(
+            custom_css,
+            media_type="text/css",
+            headers={"Cache-Control": "public, max-age=31536000, immutable"},
+        )
+
     # -------------------------------------------------------------------------
     # API ENDPOINTS (Example of JSON APIs)
     # -------------------------------------------------------------------------
     # FastHTML can also serve JSON APIs alongside HTML routes.
+    #
+    # A returned dict would be encoded with the standard json module; these
+    # endpoints use orjson instead, which is several times faster, writes
+    # bytes directly and serializes datetimes (as ISO 8601) natively.
     # -------------------------------------------------------------------------
 
+    class ORJSONResponse(Response):
+        """JSON response encoded with orjson."""
+        media_type = "application/json"
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
+
     @rt("/api/health")
     def health_check():
         """Health check endpoint for monitoring."""
-        return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+        return ORJSONResponse({"status": "healthy", "timestamp": datetime.now()})
 
     @rt("/api/stats")
     def stats(session):
         """Get application statistics (requires auth)."""
-        if not session.get("user_email"):
-            return {"error": "Unauthorized"}, 401
+        if session.get("uid") is None:
+            return ORJSONResponse({"error": "Unauthorized"}, status_code=401)
 
-        return {
-            "users": len(db.get_all_users()),
-            "allowed_emails": len(db.get_allowed_emails()),
-        }
+        return ORJSONResponse(db.get_counts())
 
     return fasthtml_app
 
@@ -1128,7 +2007,7 @@ def create_app():
 #
 # This is where we tie everything together and deploy to Modal.
 #
-# The @app.function decorator defines a Modal function with:
+# The @modal_app.function decorator defines a Modal function with:
 # - image: The container environment
 # - volumes: Persistent storage mounts
 # - secrets: Injected environment variables
@@ -1136,7 +2015,7 @@ def create_app():
 # The @modal.asgi_app decorator exposes the function as a web endpoint.
 # =============================================================================
 
-@app.function(
+@modal_app.function(
     # Use our custom container image with FastHTML installed
     image=image,
 
@@ -1156,11 +2035,13 @@ def create_app():
     # scaledown_window: How long to keep warm containers alive
     # This reduces cold start latency for subsequent requests
     scaledown_window=300,  # 5 minutes
+    # To avoid cold starts entirely, keep a container running at all times
+    # (billed while idle): min_containers=1
 )
 # Allow concurrent requests to the same container
 # This improves performance by reusing warm containers
 # Note: SQLite handles concurrent reads well, but writes are serialized
-@modal.concurrent(max_inputs=10)
+@modal.concurrent(max_inputs=MAX_CONCURRENT_INPUTS)
 @modal.asgi_app()
 def web():
     """
@@ -1188,7 +2069,7 @@ def web():
 #     modal run app.py::function_name
 # =============================================================================
 
-@app.function(image=image, volumes={VOLUME_PATH: volume})
+@modal_app.function(image=image, volumes={VOLUME_PATH: volume})
 def init_admin(email: str):
     """
     Initialize an admin user.
@@ -1199,14 +2080,16 @@ def init_admin(email: str):
     This adds the email to the allowed list and sets up initial access.
     """
     db = Database(DATABASE_PATH, volume)
-    db.add_allowed_email(email, added_by="cli")
+    # unit_of_work() commits the volume before we report success
+    with db.unit_of_work():
+        db.add_allowed_email(email, added_by="cli")
     print(f"Added {email} to allowed emails list")
     print("This user will be able to log in and access the application.")
     print("To make them an admin, they must first log in, then you can")
     print("update the database directly or add admin functionality.")
 
 
-@app.function(image=image, volumes={VOLUME_PATH: volume})
+@modal_app.function(image=image, volumes={VOLUME_PATH: volume})
 def list_users():
     """
     List all users and allowed emails.
@@ -1227,7 +2110,7 @@ def list_users():
         print(f"    Last login: {user.last_login or 'Never'}")
 
 
-@app.function(image=image, volumes={VOLUME_PATH: volume})
+@modal_app.function(image=image, volumes={VOLUME_PATH: volume})
 def make_admin(email: str):
     """
     Grant admin privileges to a user.
@@ -1244,7 +2127,8 @@ def make_admin(email: str):
         print(f"Error: User {email} not found. They must log in first.")
         return
 
-    db.set_admin(email, True)
+    with db.unit_of_work():
+        db.set_admin(email, True)
     print(f"Granted admin privileges to {email}")
 
 
@@ -1258,22 +2142,51 @@ def make_admin(email: str):
 # Note: This won't work in Modal's container - it's just for local dev.
 # =============================================================================
 
-if __name__ == "__main__":
-    print("""
+# The banner is a module-level constant so it is built once into the .pyc,
+# and written with a single write() rather than formatted through print().
+_BANNER: Final[str] = """
     ╔════════════════════════════════════════════════════════════════════╗
     ║                    StatefulModal Template                          ║
     ╠════════════════════════════════════════════════════════════════════╣
     ║                                                                    ║
     ║  For local development:                                            ║
-    ║      modal serve app.py                                            ║
+    ║      modal serve app.py::modal_app                                 ║
     ║                                                                    ║
     ║  For production deployment:                                        ║
-    ║      modal deploy app.py                                           ║
+    ║      modal deploy app.py::modal_app                                ║
     ║                                                                    ║
     ║  To add an initial admin:                                          ║
     ║      modal run app.py::init_admin --email=you@example.com          ║
     ║                                                                    ║
+    ║  Containers open their database connections at startup, so the     ║
+    ║  first request is served from a warm pool.                         ║
+    ║                                                                    ║
     ║  See README.md for complete setup instructions.                    ║
     ║                                                                    ║
     ╚════════════════════════════════════════════════════════════════════╝
-    """)
+"""
+
+
+def _print_banner():
+    """
+    Write the banner straight to the stdout file descriptor.
+
+    os.write() skips the text layer's encoding and buffering. When stdout
+    has no real file descriptor (e.g. captured by a test runner), fall back
+    to sys.stdout.write().
+    """
+    import sys
+
+    try:
+        os.write(sys.stdout.fileno(), _BANNER.encode("utf-8"))
+    except OSError:
+        sys.stdout.write(_BANNER)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Only show it to a person at a terminal; skip it when output is piped
+    # or redirected (CI, scripts), where it would just be noise.
+    if sys.stdout.isatty():
+        _print_banner()
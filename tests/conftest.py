@@ -0,0 +1,63 @@
+"""Shared fixtures: a create_app() instance on a throwaway database."""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+import statefulmodal.app as app_module
+
+COOKIE = "session_"  # fast_app()'s default session cookie name
+
+
+@pytest.fixture
+def session_secret():
+    return "test-secret"
+
+
+@pytest.fixture
+def volume():
+    """The Modal Volume passed to the app's Database; override in a module to fake one."""
+    return None
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, session_secret, volume):
+    monkeypatch.setenv("SESSION_SECRET", session_secret)
+    monkeypatch.delenv("GOOGLE_CLIENT_ID", raising=False)
+    monkeypatch.delenv("INITIAL_ADMIN_EMAIL", raising=False)
+    monkeypatch.setattr(app_module, "DATABASE_PATH", str(tmp_path / "app.db"))
+    monkeypatch.setattr(app_module, "volume", volume)
+    return TestClient(app_module.create_app())
+
+
+@pytest.fixture
+def make_cookie(session_secret):
+    """Build a session cookie the way the middleware does: payload.issued.signature."""
+    def make_cookie(session, issued=None, secret=session_secret):
+        def b64(data):
+            return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+        payload = b64(json.dumps(session, separators=(",", ":")).encode())
+        message = f"{payload}.{int(time.time()) if issued is None else issued}"
+        signature = b64(hmac.new(secret.encode(), message.encode(), hashlib.sha256).digest())
+        return f"{message}.{signature}"
+
+    return make_cookie
+
+
+@pytest.fixture
+def login(client, make_cookie):
+    """Create an allowed user and log the client in as them; returns the User."""
+    def login(email="user@example.com", name="User"):
+        db = app_module.Database(app_module.DATABASE_PATH)
+        db.add_allowed_email(email)
+        user = db.get_or_create_user(email, name)
+        client.cookies.set(COOKIE, make_cookie({"uid": user.id}))
+        return user
+
+    return login
@@ -0,0 +1,46 @@
+"""Tests for the signed session cookie (SignedCookieSessionMiddleware in create_app)."""
+
+import pytest
+from conftest import COOKIE
+
+
+def get_stats(client, cookie):
+    # Send the raw header so non-ASCII values reach the app unchanged
+    return client.get("/api/stats", headers={"cookie": f"{COOKIE}={cookie}".encode("latin-1")})
+
+
+def test_valid_cookie_is_accepted(client, make_cookie):
+    response = get_stats(client, make_cookie({"uid": 1}))
+    assert response.status_code == 200
+    # An unchanged, fresh session isn't re-sent
+    assert "set-cookie" not in response.headers
+
+
+def test_tampered_cookie_is_rejected(client, make_cookie):
+    payload, issued, signature = make_cookie({"uid": 1}).split(".")
+    forged = make_cookie({"uid": 2}).split(".")[0]
+    for cookie in (
+        f"{forged}.{issued}.{signature}",                # payload swapped
+        f"{payload}.{int(issued) + 1}.{signature}",      # timestamp changed
+        make_cookie({"uid": 1}, secret="other-secret"),  # wrong key
+    ):
+        response = get_stats(client, cookie)
+        assert response.status_code == 401
+        # The invalid cookie is cleared
+        assert response.headers["set-cookie"].startswith(f"{COOKIE}=null;")
+
+
+def test_expired_cookie_is_rejected(client, make_cookie):
+    assert get_stats(client, make_cookie({"uid": 1}, issued=0)).status_code == 401
+
+
+@pytest.mark.parametrize("cookie", [
+    "garbage",
+    "a.b",
+    "a.b.c.d",
+    "payload.notanumber.sig",
+    "payload.1.sigé",          # non-ASCII signature
+    "é.1." + "A" * 43,         # non-ASCII payload
+])
+def test_malformed_cookie_is_rejected(client, cookie):
+    assert get_stats(client, cookie).status_code == 401
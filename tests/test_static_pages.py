@@ -0,0 +1,35 @@
+"""Tests for the precompressed static pages (static_page_response in create_app)."""
+
+import pytest
+
+
+@pytest.mark.parametrize("accept_encoding, gzipped", [
+    ("gzip", True),
+    ("br, GZIP;q=0.5", True),
+    ("x-gzip", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("gzip;q=0", False),           # explicit refusal
+    ("gzip; q=0.000", False),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),        # a named coding overrides "*"
+    ("x-gzip-foo", False),         # not the gzip token
+    ("deflate, nogzip", False),
+    ("gzip;q=0, x-gzip", True),    # x-gzip is an alias for gzip
+    ("x-gzip;q=0", False),
+    ("gzip;q=abc", True),          # malformed q-values count as q=1
+    ("gzip;q=", True),
+    ("gzip;q=nan", True),
+    ("gzip;q=2", True),
+    ("gzip;q=0.5;q", True),
+    ("*;q=bogus", True),
+    (",, ;q=0,", False),
+])
+def test_gzip_is_served_only_when_accepted(client, accept_encoding, gzipped):
+    # The anonymous home page is one of the precompressed static pages
+    response = client.get("/", headers={"accept-encoding": accept_encoding})
+    assert response.status_code == 200
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert (response.headers.get("content-encoding") == "gzip") is gzipped
+    assert "StatefulModal" in response.text
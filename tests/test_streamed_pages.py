@@ -0,0 +1,41 @@
+"""Tests for the pages sent with stream_page() and streamed_rows()."""
+
+import re
+
+import pytest
+
+import statefulmodal.app as app_module
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several chunks per list, including a short last one
+    monkeypatch.setattr(app_module, "STREAM_CHUNK_ROWS", 2)
+
+
+def test_notes_list_is_streamed_in_full(client, login):
+    login()
+    for i in range(5):
+        client.post("/notes/add", data={"content": f"note {i} <b>"}, headers={"hx-request": "1"})
+
+    response = client.get("/notes")
+    assert response.status_code == 200
+    notes_list = re.search(r'<div id="notes-list" class="mt-1">(.*)</div>\n</div></main>', response.text).group(1)
+    assert notes_list.count('class="note-card"') == 5
+    assert all(f"<p>note {i} &lt;b&gt;</p>" in notes_list for i in range(5))
+    assert response.text.rstrip().endswith("</html>")
+
+
+def test_admin_lists_are_streamed_in_full(client, login):
+    user = login(email="admin@example.com", name="Admin")
+    db = app_module.Database(app_module.DATABASE_PATH)
+    db.set_admin(user.email, True)
+    for i in range(4):
+        client.post("/admin/emails/add", data={"email": f"user{i}@example.com"}, headers={"hx-request": "1"})
+
+    response = client.get("/admin")
+    assert response.status_code == 200
+    emails = re.search(r'<ul id="email-list">(.*?)</ul>', response.text, re.S).group(1)
+    assert all(f"user{i}@example.com<button" in emails for i in range(4))
+    assert "<strong>Admin</strong> (admin@example.com)" in response.text
+    assert "__ROWS__" not in response.text
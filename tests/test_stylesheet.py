@@ -0,0 +1,23 @@
+"""Tests for the content-hashed stylesheet route (/styles/{version})."""
+
+import re
+
+
+def current_css_href(client):
+    return re.search(r'href="(/styles/\w+)"', client.get("/").text).group(1)
+
+
+def test_current_version_is_cached_for_a_year(client):
+    response = client.get(current_css_href(client))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+def test_other_versions_redirect_to_the_current_one(client):
+    href = current_css_href(client)
+    for stale in ("/styles/0123456789ab", "/styles/typo", href + "0"):
+        response = client.get(stale, follow_redirects=False)
+        assert response.status_code == 302
+        assert response.headers["location"] == href
+        assert response.headers["cache-control"] == "no-store"
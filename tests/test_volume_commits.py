@@ -0,0 +1,84 @@
+"""Tests for the group commit worker when volume.commit() fails."""
+
+import threading
+
+import pytest
+from starlette.testclient import TestClient
+
+import statefulmodal.app as app_module
+
+
+class FailingVolume:
+    """A volume whose commit() raises until `healthy` is set."""
+
+    def __init__(self):
+        self.healthy = False
+        self.attempts = 0
+
+    def commit(self):
+        self.attempts += 1
+        if not self.healthy:
+            raise OSError("volume unavailable")
+
+
+class HangingVolume:
+    """A volume whose commit() blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def commit(self):
+        self.release.wait()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(app_module, "GROUP_COMMIT_MAX_INTERVAL", 0.01)
+
+
+@pytest.fixture
+def volume():
+    return FailingVolume()
+
+
+def test_flush_raises_after_repeated_failures_and_recovers(tmp_path):
+    volume = FailingVolume()
+    db = app_module.Database(str(tmp_path / "app.db"), volume)
+    db.add_allowed_email("a@example.com")
+
+    with pytest.raises(app_module.VolumeCommitError):
+        db._flush_now(timeout=10)
+    # (some attempts may belong to the schema setup's batch)
+    assert volume.attempts >= app_module.GROUP_COMMIT_MAX_ATTEMPTS
+
+    # The writes are still pending, and go out with the next successful batch
+    volume.healthy = True
+    db._flush_now(timeout=10)
+    assert db._committed_seq == db._write_seq
+
+
+def test_flush_times_out_when_commit_hangs(tmp_path):
+    volume = HangingVolume()
+    db = app_module.Database(str(tmp_path / "app.db"), volume)
+    try:
+        db.add_allowed_email("a@example.com")
+        with pytest.raises(app_module.VolumeCommitError, match="within"):
+            db._flush_now(timeout=0.2)
+    finally:
+        volume.release.set()
+
+
+def test_unit_of_work_raises_when_the_commit_fails(tmp_path):
+    db = app_module.Database(str(tmp_path / "app.db"), FailingVolume())
+    with pytest.raises(app_module.VolumeCommitError):
+        with db.unit_of_work():
+            db.add_allowed_email("a@example.com")
+
+
+def test_write_request_fails_with_500_instead_of_hanging(client, login):
+    login()
+    client = TestClient(client.app, raise_server_exceptions=False, cookies=client.cookies)
+    response = client.post("/notes/add", data={"content": "hello"}, headers={"hx-request": "1"})
+    assert response.status_code == 500
+    # Read-only requests don't wait on the volume at all
+    assert client.get("/notes").status_code == 200